@@ -7,11 +7,15 @@
 """
 
 import os
+import re
 import sys
 import subprocess
 import time
 from pathlib import Path
 
+# 打包输出中需要显示的重要信息（预编译，一次扫描即可判断整行）
+IMPORTANT_OUTPUT_RE = re.compile(r'INFO:|WARNING:|ERROR:|building')
+
 def set_offline_environment():
     """设置离线环境变量"""
     # 禁用可能的网络请求
@@ -101,10 +105,11 @@ def build_with_timeout():
             output = process.stdout.readline()
             if output:
                 # 只输出重要信息，避免刷屏
-                if any(keyword in output for keyword in ['INFO:', 'WARNING:', 'ERROR:', 'building']):
+                if IMPORTANT_OUTPUT_RE.search(output):
                     print(f"📋 {output.strip()}")
-            
-            time.sleep(0.1)  # 避免CPU占用过高
+            else:
+                # 仅在没有新输出时等待，避免逐行休眠拖慢输出读取、堵塞打包进程
+                time.sleep(0.1)  # 避免CPU占用过高
             
     except subprocess.TimeoutExpired:
         print("❌ 打包进程超时")
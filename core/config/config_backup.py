@@ -14,6 +14,10 @@ from typing import Dict, Any, List, Optional
 from core.logger import get_logger
 
 
+# 备份原因中需要替换为下划线的字符（空格和路径分隔符），一次 str.translate 完成替换
+_UNSAFE_REASON_TABLE = str.maketrans({" ": "_", "/": "_", "\\": "_"})
+
+
 class ConfigBackupManager:
     """配置备份管理器"""
     
@@ -75,7 +79,7 @@ class ConfigBackupManager:
                 return False
             
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:19]  # 精确到毫秒的前3位
-            safe_reason = reason.replace(" ", "_").replace("/", "_").replace("\\", "_")
+            safe_reason = reason.translate(_UNSAFE_REASON_TABLE)
             backup_filename = f"{self.module_name}_config_{timestamp}_{safe_reason}.json"
             backup_path = self.backup_dir / backup_filename
             
@@ -6,6 +6,7 @@
 """
 
 import json
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 
@@ -153,9 +154,14 @@ class ConfigManager:
                 self.logger.error("配置验证失败，拒绝保存")
                 return False
             
-            with open(self.user_config_path, 'w', encoding='utf-8') as f:
+            # 原子写入（先写临时文件）
+            temp_file = self.user_config_path.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(config, f, ensure_ascii=False, indent=2)
             
+            # 替换原文件
+            temp_file.replace(self.user_config_path)
+            
             # 清除缓存（配置已更新）
             self.clear_cache()
             
@@ -421,7 +427,6 @@ class ConfigManager:
         Args:
             config: 配置数据
         """
-        import time
         self._config_cache = config.copy()
         self._cache_timestamp = time.time()
         self.logger.debug("配置缓存已更新")
@@ -293,12 +293,10 @@ class ModuleManager:
         
         # 如果发现循环，抛出异常
         if cycles_found:
-            error_msg = "检测到循环依赖问题：\n\n"
-            
-            for i, cycle in enumerate(cycles_found, 1):
-                error_msg += f"循环 {i}: {' → '.join(cycle)}\n"
-            
-            error_msg += "\n请修改模块的manifest.json文件，移除循环依赖。"
+            cycle_lines = "".join(
+                f"循环 {i}: {' → '.join(cycle)}\n" for i, cycle in enumerate(cycles_found, 1)
+            )
+            error_msg = f"检测到循环依赖问题：\n\n{cycle_lines}\n请修改模块的manifest.json文件，移除循环依赖。"
             
             raise ValueError(error_msg)
         
@@ -36,6 +36,13 @@ class FileUtils:
         r'\$',    # 环境变量
     ]
     
+    # 预编译的危险模式，避免每次校验文件名时重新查找正则缓存
+    _DANGEROUS_REGEXES = tuple(map(re.compile, DANGEROUS_PATTERNS))
+    
+    # 文件名中的潜在危险字符
+    DANGEROUS_CHARS = ('<', '>', ':', '"', '|', '?', '*')
+    _DANGEROUS_CHAR_SET = frozenset(DANGEROUS_CHARS)
+    
     DANGEROUS_NAMES = {
         '..',
         '.',
@@ -141,9 +148,9 @@ class FileUtils:
             logger.error(f"❌ 文件名验证失败: '{filename}' 是危险或保留的文件名")
             return False
         
-        for pattern in FileUtils.DANGEROUS_PATTERNS:
-            if re.search(pattern, filename):
-                logger.error(f"❌ 文件名验证失败: '{filename}' 包含危险模式 '{pattern}'")
+        for regex in FileUtils._DANGEROUS_REGEXES:
+            if regex.search(filename):
+                logger.error(f"❌ 文件名验证失败: '{filename}' 包含危险模式 '{regex.pattern}'")
                 return False
         
         # 防止文件名中包含路径分隔符
@@ -153,11 +160,12 @@ class FileUtils:
         
         # Windows: < > : " | ? * (文件名中不允许)
         # Unix: 通常只有 / 和 null 不允许
-        dangerous_chars = ['<', '>', ':', '"', '|', '?', '*']
-        for char in dangerous_chars:
-            if char in filename:
-                logger.warning(f"⚠️ 文件名包含潜在危险字符: '{filename}' 包含 '{char}'")
-                # 警告但不阻止（有些系统可能允许）
+        # 先用集合判断是否包含任一危险字符，绝大多数正常文件名无需逐个字符查找
+        if not FileUtils._DANGEROUS_CHAR_SET.isdisjoint(filename):
+            for char in FileUtils.DANGEROUS_CHARS:
+                if char in filename:
+                    logger.warning(f"⚠️ 文件名包含潜在危险字符: '{filename}' 包含 '{char}'")
+                    # 警告但不阻止（有些系统可能允许）
         
         logger.debug(f"✅ 文件名验证通过: {filename}")
         return True
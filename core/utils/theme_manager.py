@@ -14,12 +14,16 @@ from enum import Enum
 from typing import Dict, Optional
 from pathlib import Path
 import json
+import re
 from PyQt6.QtWidgets import QWidget, QApplication
 from core.utils.style_loader import StyleLoader, get_style_loader
 from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 样式中的主题变量占位符，格式: ${variable_name}
+_VARIABLE_RE = re.compile(r'\$\{(\w+)\}')
+
 
 class Theme(Enum):
     """主题枚举"""
@@ -65,6 +69,8 @@ class ThemeManager:
         self._theme_variables: Dict[str, str] = {}
         self._custom_variables: Dict[str, str] = {}
         self._custom_themes: Dict[str, Dict[str, str]] = {}  # 存储所有导入的自定义主题
+        # 原始样式 -> 替换变量后的样式，主题变量变化时清空
+        self._resolved_styles: Dict[str, str] = {}
         
         self._load_custom_themes()
         
@@ -163,6 +169,7 @@ class ThemeManager:
         
         # 合并自定义变量
         self._theme_variables.update(self._custom_variables)
+        self._resolved_styles.clear()
         
         logger.debug(f"加载主题变量完成，共 {len(self._theme_variables)} 个变量")
     
@@ -225,6 +232,7 @@ class ThemeManager:
         """
         self._custom_variables[name] = value
         self._theme_variables[name] = value
+        self._resolved_styles.clear()
         logger.debug(f"设置自定义变量: {name} = {value}")
     
     def apply_to_widget(self,
@@ -280,20 +288,26 @@ class ThemeManager:
         
         支持格式: ${variable_name}
         
+        同一样式在主题变量未变化时只替换一次（如逐个按钮应用主题），结果缓存复用。
+        
         Args:
             style: 原始样式字符串
             
         Returns:
             str: 替换后的样式字符串
         """
-        import re
+        resolved = self._resolved_styles.get(style)
+        if resolved is not None:
+            return resolved
         
         # 替换 ${variable_name} 格式的变量
         def replacer(match):
             var_name = match.group(1)
             return self.get_variable(var_name)
         
-        return re.sub(r'\$\{(\w+)\}', replacer, style)
+        resolved = _VARIABLE_RE.sub(replacer, style)
+        self._resolved_styles[style] = resolved
+        return resolved
     
     def _get_inline_style(self, component: Optional[str] = None) -> str:
         """获取内联样式作为回退
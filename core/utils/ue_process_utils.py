@@ -4,15 +4,58 @@
 import psutil
 import logging
 import os
+import re
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import string
 from core.logger import get_logger
 
 
+# 全盘工程搜索结果缓存：(缓存时间, 工程列表)
+# 搜索需要遍历多个磁盘目录，短时间内重复打开工程选择窗口时直接复用结果
+PROJECT_SEARCH_CACHE_TTL = 30.0
+_project_search_cache: Optional[Tuple[float, List['UEProcess']]] = None
+_project_search_cache_lock = threading.Lock()
+
+
+# 搜索工程时需要排除的路径片段（大小写不敏感）
+# 更精确的排除规则，避免误排除用户自定义路径
+_EXCLUDE_PATH_PATTERNS = (
+    "Epic Games",
+    "Program Files",
+    "Windows",
+    "\\Engine\\",  # 引擎源码目录
+    "\\Templates\\",  # 官方模板
+    "\\Samples\\",  # 官方示例
+    "\\FeaturePacks\\",  # 功能包
+    "\\Marketplace\\",  # 市场内容
+    "AppData",
+    "$Recycle.Bin",
+    "Recycled",
+    "System Volume Information",
+    "\\temp\\",
+    "\\tmp\\",
+)
+
+# 预编译为单个正则，一次扫描即可判断路径是否命中任意排除片段
+_EXCLUDE_PATH_RE = re.compile("|".join(re.escape(pattern.lower()) for pattern in _EXCLUDE_PATH_PATTERNS))
+
+
+def clear_project_search_cache() -> None:
+    """清除全盘工程搜索结果缓存，下次搜索将重新遍历磁盘"""
+    global _project_search_cache
+    with _project_search_cache_lock:
+        _project_search_cache = None
+
+
 class UEProcess:
     """UE进程信息类"""
     
+    # 全盘搜索可能创建大量实例，使用 __slots__ 减少内存占用并加快属性访问
+    __slots__ = ('pid', 'name', 'project_path')
+    
     def __init__(self, pid: int, name: str, project_path: Path):
         self.pid = pid
         self.name = name
@@ -89,23 +132,55 @@ class UEProcessUtils:
             self.logger.error(f"提取工程路径时发生错误: {e}")
             return None
     
-    def search_all_ue_projects(self) -> List[UEProcess]:
+    def search_all_ue_projects(self, use_cache: bool = True) -> List[UEProcess]:
         """快速搜索系统中的UE工程
         
+        搜索结果会缓存 PROJECT_SEARCH_CACHE_TTL 秒，期间重复调用直接返回缓存结果。
+        
+        Args:
+            use_cache: 是否使用缓存结果（默认True），为False时强制重新搜索
+        
         Returns:
             List[UEProcess]: 所有找到的UE工程列表
         """
+        global _project_search_cache
+        
+        if use_cache:
+            with _project_search_cache_lock:
+                cached = _project_search_cache
+            if cached is not None and time.monotonic() - cached[0] < PROJECT_SEARCH_CACHE_TTL:
+                self.logger.info(f"使用缓存的工程搜索结果，共 {len(cached[1])} 个UE工程")
+                return list(cached[1])
+        
         self.logger.info("开始快速搜索系统中的UE工程")
         
         try:
             # 使用优化的搜索算法
             projects = self._quick_search_ue_projects()
             self.logger.info(f"搜索完成，共发现 {len(projects)} 个UE工程")
+            with _project_search_cache_lock:
+                _project_search_cache = (time.monotonic(), list(projects))
             return projects
         except Exception as e:
             self.logger.error(f"搜索UE工程时发生错误: {e}")
             return []
     
+    def detect_and_search_ue_projects(self) -> Tuple[List[UEProcess], List[UEProcess]]:
+        """同时检测运行中的UE工程并搜索系统中的所有UE工程
+        
+        进程检测与磁盘搜索互不依赖，放在两个线程中并行执行，
+        总耗时取两者中较长的一个，而不是两者之和。
+        
+        Returns:
+            Tuple[List[UEProcess], List[UEProcess]]: (运行中的工程列表, 所有工程列表)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            running_future = executor.submit(self.detect_running_ue_projects)
+            all_future = executor.submit(self.search_all_ue_projects)
+            return running_future.result(), all_future.result()
+    
     def _quick_search_ue_projects(self) -> List[UEProcess]:
         """快速搜索UE工程的核心算法"""
         from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -124,31 +199,18 @@ class UEProcessUtils:
                     self.logger.warning(f"搜索位置时发生错误: {e}")
                     continue
         
-        filtered_results = self._apply_exclusion_rules(ue_projects)
+        # 搜索位置可能相互嵌套（如环境变量指定的目录位于文档目录下），同一工程会被找到多次，按规范化路径去重
+        unique_projects: Dict[str, UEProcess] = {}
+        for project in ue_projects:
+            key = os.path.normcase(os.path.abspath(project.project_path))
+            unique_projects.setdefault(key, project)
+        
+        filtered_results = self._apply_exclusion_rules(list(unique_projects.values()))
         return filtered_results
     
     def _should_exclude_path(self, path: Path) -> bool:
         """检查路径是否应该被排除"""
-        # 更精确的排除规则，避免误排除用户自定义路径
-        exclude_patterns = [
-            "Epic Games", 
-            "Program Files", 
-            "Windows", 
-            "\\Engine\\",  # 引擎源码目录
-            "\\Templates\\",  # 官方模板
-            "\\Samples\\",  # 官方示例
-            "\\FeaturePacks\\",  # 功能包
-            "\\Marketplace\\",  # 市场内容
-            "AppData",
-            "$Recycle.Bin", 
-            "Recycled", 
-            "System Volume Information",
-            "\\temp\\", 
-            "\\tmp\\"
-        ]
-        path_str = str(path).replace("\\", "\\\\")  # 转义反斜杠
-        path_lower = path_str.lower()
-        return any(pattern.lower() in path_lower for pattern in exclude_patterns)
+        return _EXCLUDE_PATH_RE.search(str(path).lower()) is not None
     
     def _get_common_project_locations(self) -> List[Path]:
         """获取常见项目位置"""
@@ -187,26 +249,14 @@ class UEProcessUtils:
                 locations.append(env_path)
         
         # 添加一些常见的自定义路径
-        custom_paths = [
+        locations.extend([
             Path("D:\\UnrealEngine"),  # 直接添加您的路径
             Path("C:\\UnrealEngine"),
             Path("E:\\UnrealEngine")
-        ]
-        for custom_path in custom_paths:
-            if custom_path.exists():
-                locations.append(custom_path)
-        
-        # 去除重复路径
-        unique_locations = []
-        seen_paths = set()
-        for loc in locations:
-            if loc.exists():
-                path_str = str(loc)
-                if path_str not in seen_paths:
-                    unique_locations.append(loc)
-                    seen_paths.add(path_str)
+        ])
         
-        return unique_locations
+        # 先按原有顺序去重，再过滤不存在的路径，重复路径只检查一次是否存在
+        return [loc for loc in dict.fromkeys(locations) if loc.exists()]
     
     def _search_location(self, location: Path) -> List[UEProcess]:
         """搜索指定位置的UE工程"""
@@ -272,15 +322,14 @@ class UEProcessUtils:
         Returns:
             bool: 工程是否正在运行
         """
-        from pathlib import Path
         project_path = Path(project_path) if not isinstance(project_path, Path) else project_path
         
         try:
             running_projects = self.detect_running_ue_projects()
-            for running_project in running_projects:
-                if running_project.project_path.resolve() == project_path.resolve():
-                    return True
-            return False
+            # 目标路径只需解析一次，不必在每次比较时重复解析
+            target_path = project_path.resolve()
+            return any(running_project.project_path.resolve() == target_path
+                       for running_project in running_projects)
         except Exception as e:
             self.logger.error(f"检查工程运行状态时发生错误: {e}")
             return False
\ No newline at end of file
@@ -15,6 +15,21 @@ from core.logger import get_logger
 logger = get_logger(__name__)
 
 
+# 预编译的校验正则
+_IP_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+# 域名可以包含字母、数字、连字符和点，不能以连字符开始或结束
+_DOMAIN_RE = re.compile(r'^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?$')
+# 文件名中的非法字符（Windows）
+_ILLEGAL_FILENAME_CHARS = r'<>"|?*'
+_ILLEGAL_FILENAME_CHAR_SET = frozenset(_ILLEGAL_FILENAME_CHARS)
+# 文件名中不安全的字符：Windows 不允许的 < > : " / \ | ? * 以及控制字符（Unix 不允许 / 和 null）
+_UNSAFE_FILENAME_ORDS = tuple(map(ord, '<>:"/\\|?*')) + tuple(range(0x20))
+# 默认替换字符对应的转换表，供 str.translate 使用
+_UNSAFE_FILENAME_TABLE = dict.fromkeys(_UNSAFE_FILENAME_ORDS, '_')
+# 语义化版本号
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(?:-[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$")
+
+
 class InputValidator:
     """输入验证器
     
@@ -73,9 +88,8 @@ class InputValidator:
                 return False, f"不允许的文件类型: {p.suffix}，允许的类型: {', '.join(allowed_extensions)}"
             
             # 检查文件名中的非法字符（Windows）
-            illegal_chars = r'<>"|?*'
-            if any(char in str(p.name) for char in illegal_chars):
-                return False, f"文件名包含非法字符: {illegal_chars}"
+            if not _ILLEGAL_FILENAME_CHAR_SET.isdisjoint(p.name):
+                return False, f"文件名包含非法字符: {_ILLEGAL_FILENAME_CHARS}"
             
             return True, ""
             
@@ -138,8 +152,7 @@ class InputValidator:
                 
                 # 允许localhost和本地IP
                 if domain not in ['localhost', '127.0.0.1', '0.0.0.0']:
-                    ip_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-                    if re.match(ip_pattern, domain):
+                    if _IP_RE.match(domain):
                         parts = domain.split('.')
                         for part in parts:
                             if int(part) > 255:
@@ -147,8 +160,7 @@ class InputValidator:
                     else:
                         # 域名可以包含字母、数字、连字符和点
                         # 不能以连字符开始或结束
-                        domain_pattern = r'^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?$'
-                        if not re.match(domain_pattern, domain):
+                        if not _DOMAIN_RE.match(domain):
                             return False, f"域名格式不正确: {domain}"
                         
                         if len(domain) > 253:
@@ -218,11 +230,12 @@ class InputValidator:
             )
             # 结果: "my_file_name_.txt"
         """
-        # 移除Windows和Unix不允许的字符
-        # Windows: < > : " / \ | ? *
-        # Unix: / (null)
-        unsafe_pattern = r'[<>:"/\\|?*\x00-\x1f]'
-        safe_filename = re.sub(unsafe_pattern, replacement, filename)
+        # 移除Windows和Unix不允许的字符（单字符替换使用 str.translate，无需经过正则引擎）
+        if replacement == '_':
+            table = _UNSAFE_FILENAME_TABLE
+        else:
+            table = dict.fromkeys(_UNSAFE_FILENAME_ORDS, replacement)
+        safe_filename = filename.translate(table)
         
         # 移除首尾空格和点
         safe_filename = safe_filename.strip('. ')
@@ -280,10 +293,7 @@ class InputValidator:
         Example:
             valid, error = InputValidator.validate_version("1.0.0")
         """
-        # 语义化版本号正则表达式
-        semver_pattern = r"^\d+\.\d+\.\d+(?:-[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$"
-        
-        if not re.match(semver_pattern, version):
+        if not _SEMVER_RE.match(version):
             return False, f"版本号格式不正确: '{version}'，应该是 'major.minor.patch' 格式 (如 '1.0.0')"
         
         return True, ""
@@ -4,22 +4,19 @@
 资产管理逻辑层
 """
 
+import os
+import sys
+import time
 import uuid
 import shutil
 import json
 import subprocess
 import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-try:
-    from pypinyin import lazy_pinyin, Style
-except ImportError:
-    # 如果pypinyin未安装，使用简单的拼音映射
-    lazy_pinyin = None
-    Style = None
-
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from core.logger import get_logger
@@ -29,6 +26,154 @@ from .asset_model import Asset, AssetType
 logger = get_logger(__name__)
 
 
+# pypinyin 导入需要加载拼音词典，耗时较长，推迟到首次需要转换非ASCII文本时再导入
+# None 表示尚未导入，False 表示 pypinyin 未安装
+_pinyin_funcs = None
+
+
+def _get_pinyin_funcs():
+    """延迟导入 pypinyin
+    
+    Returns:
+        (lazy_pinyin, Style) 元组，pypinyin 未安装时返回 False
+    """
+    global _pinyin_funcs
+    if _pinyin_funcs is None:
+        try:
+            from pypinyin import lazy_pinyin, Style
+            _pinyin_funcs = (lazy_pinyin, Style)
+        except ImportError:
+            # 如果pypinyin未安装，使用简单的拼音映射
+            _pinyin_funcs = False
+    return _pinyin_funcs
+
+
+# 虚幻引擎编辑器的常见进程名
+_UE_EDITOR_PROCESS_NAMES = frozenset({
+    'UE4Editor.exe',
+    'UE4Editor-Win64-Debug.exe',
+    'UE4Editor-Win64-DebugGame.exe',
+    'UnrealEditor.exe',
+    'UnrealEditor-Win64-Debug.exe',
+    'UnrealEditor-Win64-DebugGame.exe',
+})
+
+
+def _created_time_sort_key(asset: Asset):
+    """按创建时间排序的键（使用安全的排序键，确保 created_time 不为 None）"""
+    return asset.created_time if asset.created_time else datetime.min
+
+
+def _name_sort_key(asset: Asset):
+    """按名称排序的键"""
+    return asset.name.lower()
+
+
+def _category_sort_key(asset: Asset):
+    """按分类排序的键，同分类内按名称排序"""
+    return (asset.category.lower(), asset.name.lower())
+
+
+# 排序方式 -> (排序键, 是否降序)
+_SORT_METHODS = {
+    "添加时间（最新）": (_created_time_sort_key, True),
+    "添加时间（最旧）": (_created_time_sort_key, False),
+    "名称（A-Z）": (_name_sort_key, False),
+    "名称（Z-A）": (_name_sort_key, True),
+    "分类（A-Z）": (_category_sort_key, False),
+    "分类（Z-A）": (_category_sort_key, True),
+}
+
+
+def _get_dir_size(path: Path) -> int:
+    """递归计算文件夹大小（字节）
+    
+    使用 os.scandir 遍历，目录项自带文件类型信息（Windows 上还缓存了文件大小），
+    比 rglob + is_file + stat 少很多系统调用。无法访问的文件和文件夹会被跳过。
+    
+    Args:
+        path: 文件夹路径
+        
+    Returns:
+        文件夹内所有文件的总大小
+    """
+    total_size = 0
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total_size
+
+
+@lru_cache(maxsize=4096)
+def _cached_pinyin(text: str) -> str:
+    """获取文本的拼音（带缓存）
+    
+    资产名称、描述和分类在多次搜索之间基本不变，缓存转换结果，
+    避免每次输入搜索文本时都对所有资产重新进行拼音转换。
+    
+    Args:
+        text: 输入文本
+        
+    Returns:
+        拼音字符串（小写，无空格）
+    """
+    if text.isascii():
+        # 纯ASCII文本无汉字可转换，直接返回小写形式，无需导入 pypinyin
+        return text.lower()
+    
+    pinyin_funcs = _get_pinyin_funcs()
+    if not pinyin_funcs:
+        # 如果没有pypinyin，返回原文本的小写形式
+        return text.lower()
+    
+    lazy_pinyin, Style = pinyin_funcs
+    try:
+        pinyin_list = lazy_pinyin(text, style=Style.NORMAL)
+        return ''.join(pinyin_list).lower()
+    except Exception as e:
+        logger.warning(f"拼音转换失败: {e}")
+        return text.lower()
+
+
+@lru_cache(maxsize=4096)
+def _search_haystack(name: str, description: str, category: str) -> str:
+    """获取资产用于原文匹配的搜索文本（带缓存）
+    
+    将名称、描述和分类的小写形式用 \\x00 连接，一次子串查找即可覆盖三个字段；
+    分隔符不会出现在搜索文本中，因此不会产生跨字段的误匹配。
+    
+    Args:
+        name: 资产名称
+        description: 资产描述
+        category: 资产分类
+        
+    Returns:
+        连接后的小写搜索文本
+    """
+    return "\x00".join((name.lower(), description.lower(), category.lower()))
+
+
+@lru_cache(maxsize=4096)
+def _pinyin_haystack(name: str, description: str, category: str) -> str:
+    """获取资产用于拼音匹配的搜索文本（带缓存），格式同 _search_haystack"""
+    return "\x00".join((
+        _cached_pinyin(name),
+        _cached_pinyin(description) if description else "",
+        _cached_pinyin(category),
+    ))
+
+
 class AssetManagerLogic(QObject):
     """资产管理逻辑类
     
@@ -60,6 +205,9 @@ class AssetManagerLogic(QObject):
         # 本地配置路径（在资产库目录下，只在需要时初始化）
         self.local_config_path = None
         
+        # 最近一次从磁盘读取或写入的本地配置内容：(配置路径, JSON文本)，用于跳过未变化的重复保存
+        self._local_config_snapshot: Optional[tuple] = None
+        
         # 本地缩略图目录（将在 _load_config 中设置）
         self.thumbnails_dir = None
         
@@ -69,6 +217,9 @@ class AssetManagerLogic(QObject):
         # 资产列表
         self.assets: List[Asset] = []
         
+        # 资产ID索引（与 self.assets 同步维护），用于 get_asset 的O(1)查找
+        self._asset_index: Dict[str, Asset] = {}
+        
         # 分类列表
         self.categories: List[str] = ["默认分类"]
         
@@ -100,6 +251,7 @@ class AssetManagerLogic(QObject):
         if not asset_library_path or not Path(asset_library_path).exists():
             logger.warning("资产库路径未设置或不存在，不加载任何资产")
             self.assets.clear()
+            self._asset_index.clear()
             self.assets_loaded.emit(self.assets)
             return
         
@@ -225,6 +377,7 @@ class AssetManagerLogic(QObject):
             cached_assets_data: 缓存的资产数据（用于恢复元数据）
         """
         self.assets.clear()
+        self._asset_index.clear()
         
         # 创建缓存字典，key为资产路径，value为资产数据
         cached_assets_dict = {}
@@ -235,6 +388,9 @@ class AssetManagerLogic(QObject):
         
         logger.info(f"开始扫描资产库: {library_path}")
         
+        # 逐个资产的常规情况（从缓存恢复）只计数，扫描结束后汇总输出一次日志
+        restored_count = 0
+        
         # 遍历所有分类文件夹
         for category in self.categories:
             category_folder = library_path / category
@@ -270,7 +426,6 @@ class AssetManagerLogic(QObject):
                             # 验证缩略图文件是否存在
                             if thumbnail_candidate.exists():
                                 thumbnail_path = thumbnail_candidate
-                                logger.debug(f"找到有效的缩略图: {cached_data['name']} -> {thumbnail_path}")
                             else:
                                 logger.warning(f"缩略图文件不存在，将跳过: {thumbnail_candidate}")
                                 # 尝试从标准缩略图目录查找
@@ -278,6 +433,9 @@ class AssetManagerLogic(QObject):
                                 if thumbnail_path:
                                     logger.info(f"从缩略图目录恢复了缩略图: {cached_data['name']}")
                         
+                        # 缺少创建时间时直接使用当前时间，不必先格式化为字符串再解析回来
+                        created_time_str = cached_data.get("created_time")
+                        
                         asset = Asset(
                             id=cached_data["id"],
                             name=cached_data["name"],
@@ -288,10 +446,10 @@ class AssetManagerLogic(QObject):
                             thumbnail_path=thumbnail_path,
                             thumbnail_source=cached_data.get("thumbnail_source"),
                             size=cached_data.get("size", 0),
-                            created_time=datetime.fromisoformat(cached_data.get("created_time", datetime.now().isoformat())),
+                            created_time=datetime.fromisoformat(created_time_str) if created_time_str else datetime.now(),
                             description=cached_data.get("description", "")
                         )
-                        logger.debug(f"从缓存恢复资产: {asset.name}")
+                        restored_count += 1
                     else:
                         asset_id = str(uuid.uuid4())
                         asset_name = item.stem if item.is_file() else item.name
@@ -312,11 +470,12 @@ class AssetManagerLogic(QObject):
                         logger.info(f"发现新资产: {asset.name}")
                     
                     self.assets.append(asset)
+                    self._asset_index[asset.id] = asset
                     
                 except Exception as e:
                     logger.error(f"扫描资产失败 {item}: {e}", exc_info=True)
         
-        logger.info(f"资产库扫描完成，共加载 {len(self.assets)} 个资产")
+        logger.info(f"资产库扫描完成，共加载 {len(self.assets)} 个资产（其中 {restored_count} 个从缓存恢复）")
         
         # 迁移缩略图和文档到本地目录
         self._migrate_thumbnails_and_docs()
@@ -330,14 +489,11 @@ class AssetManagerLogic(QObject):
         if path.is_file():
             return path.stat().st_size
         elif path.is_dir():
-            total_size = 0
             try:
-                for item in path.rglob('*'):
-                    if item.is_file():
-                        total_size += item.stat().st_size
+                return _get_dir_size(path)
             except Exception as e:
                 logger.warning(f"计算文件夹大小失败 {path}: {e}")
-            return total_size
+                return 0
         return 0
     
     def _find_thumbnail_by_asset_id(self, asset_id: str) -> Optional[Path]:
@@ -369,6 +525,7 @@ class AssetManagerLogic(QObject):
     def _load_assets_from_config(self, assets_data: List[Dict[str, Any]]) -> None:
         """从配置数据加载资产列表"""
         self.assets.clear()
+        self._asset_index.clear()
         
         for asset_data in assets_data:
             try:
@@ -399,6 +556,7 @@ class AssetManagerLogic(QObject):
                 
                 if asset.path.exists():
                     self.assets.append(asset)
+                    self._asset_index[asset.id] = asset
                 else:
                     logger.warning(f"资产路径不存在，跳过: {asset.path}")
                     
@@ -466,7 +624,9 @@ class AssetManagerLogic(QObject):
         
         try:
             with open(self.local_config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                config_text = f.read()
+            config = json.loads(config_text)
+            self._local_config_snapshot = (self.local_config_path, config_text)
             
             # 检查版本并进行迁移
             version = config.get("_version", "1.0.0")
@@ -524,19 +684,24 @@ class AssetManagerLogic(QObject):
             if "_version" not in config:
                 config["_version"] = "2.0.0"
             
+            # 内容与磁盘上的配置一致时无需重写（如启动扫描后资产库没有任何变化）
+            config_text = json.dumps(config, ensure_ascii=False, indent=2)
+            if self._local_config_snapshot == (self.local_config_path, config_text):
+                logger.debug(f"本地配置未变化，跳过保存: {self.local_config_path}")
+                return True
+            
             # 创建备份前先备份旧配置（如果存在），然后备份新配置
             try:
                 backup_dir = self.local_config_path.parent / "backup"
                 backup_dir.mkdir(parents=True, exist_ok=True)
                 
                 # 创建带时间戳的备份文件（备份的是即将保存的新配置）
-                from datetime import datetime
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = backup_dir / f"config_{timestamp}.json"
                 
                 # 备份即将保存的完整配置内容
                 with open(backup_path, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, ensure_ascii=False, indent=2)
+                    f.write(config_text)
                 logger.debug(f"已创建本地配置备份: {backup_path}")
                 
                 # 清理旧备份，只保留最近 5 个
@@ -551,9 +716,12 @@ class AssetManagerLogic(QObject):
             except Exception as e:
                 logger.warning(f"创建备份失败: {e}")
             
-            # 保存配置到本地文件
-            with open(self.local_config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            # 原子写入（先写临时文件再替换），避免写入中断导致配置文件损坏
+            temp_file = self.local_config_path.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(config_text)
+            temp_file.replace(self.local_config_path)
+            self._local_config_snapshot = (self.local_config_path, config_text)
             
             logger.info(f"成功保存本地配置: {self.local_config_path}")
             return True
@@ -583,6 +751,14 @@ class AssetManagerLogic(QObject):
                 self.error_occurred.emit(error_msg)
                 return None
             
+            # 源路径已是资产库中的资产时直接拒绝，避免对同一资产重复移动、计算大小和保存配置
+            source_key = os.path.normcase(os.path.abspath(asset_path))
+            if any(os.path.normcase(os.path.abspath(asset.path)) == source_key for asset in self.assets):
+                error_msg = f"该资产已在资产库中: {asset_path}"
+                logger.warning(error_msg)
+                self.error_occurred.emit(error_msg)
+                return None
+            
             library_path = self.get_asset_library_path()
             if not library_path or not library_path.exists():
                 error_msg = "资产库路径未设置或不存在，请先设置资产库路径"
@@ -653,6 +829,7 @@ class AssetManagerLogic(QObject):
             
             # 添加到列表
             self.assets.append(asset)
+            self._asset_index[asset.id] = asset
             
             logger.info("开始保存配置...")
             self.progress_updated.emit(0, 1, "正在保存配置...")
@@ -687,9 +864,6 @@ class AssetManagerLogic(QObject):
             asset: 资产对象
         """
         try:
-            import subprocess
-            from pathlib import Path
-            
             # 使用本地文档目录（在资产库目录下）
             if not self.documents_dir:
                 logger.error("本地文档目录未设置")
@@ -735,7 +909,6 @@ class AssetManagerLogic(QObject):
             logger.info(f"已创建文本文档: {doc_path}")
             
             # 用记事本打开
-            import sys
             if sys.platform == "win32":
                 subprocess.Popen(['notepad', str(doc_path)])
                 logger.info(f"已用记事本打开文档: {doc_path}")
@@ -795,6 +968,7 @@ class AssetManagerLogic(QObject):
             
             # 从列表中删除
             self.assets = [a for a in self.assets if a.id != asset_id]
+            self._asset_index.pop(asset_id, None)
             
             # 删除缩略图
             if asset.thumbnail_path and asset.thumbnail_path.exists():
@@ -829,10 +1003,7 @@ class AssetManagerLogic(QObject):
     
     def get_asset(self, asset_id: str) -> Optional[Asset]:
         """获取指定资产"""
-        for asset in self.assets:
-            if asset.id == asset_id:
-                return asset
-        return None
+        return self._asset_index.get(asset_id)
     
     def get_all_assets(self, category: Optional[str] = None) -> List[Asset]:
         """获取所有资产
@@ -969,22 +1140,13 @@ class AssetManagerLogic(QObject):
         Returns:
             拼音字符串（小写，无空格）
         """
-        if lazy_pinyin is None:
-            # 如果没有pypinyin，返回原文本的小写形式
-            return text.lower()
-        
-        try:
-            pinyin_list = lazy_pinyin(text, style=Style.NORMAL)
-            return ''.join(pinyin_list).lower()
-        except Exception as e:
-            logger.warning(f"拼音转换失败: {e}")
-            return text.lower()
+        return _cached_pinyin(text)
     
     def search_assets(self, search_text: str, category: Optional[str] = None) -> List[Asset]:
         """搜索资产（支持拼音模糊搜索）
         
         Args:
-            search_text: 搜索文本（支持中文和拼音）
+            search_text: 搜索文本（支持中文和拼音），多个关键词用空格分隔时需全部匹配
             category: 可选，指定分类名称
             
         Returns:
@@ -994,32 +1156,27 @@ class AssetManagerLogic(QObject):
             # 如果搜索文本为空，返回所有资产
             return self.get_all_assets(category)
         
+        # 只读遍历，不分类时直接遍历资产列表，无需像 get_all_assets 那样先复制一份
+        candidates = self.assets if category is None else self.get_all_assets(category)
+        if not candidates:
+            # 分类下没有资产时无需进行任何匹配（包括搜索文本的拼音转换）
+            return []
+        
         search_text = search_text.strip().lower()
-        search_pinyin = self._get_pinyin(search_text)
+        # 按空白拆分为多个关键词，每个关键词可按原文或拼音匹配
+        search_terms = [(term, self._get_pinyin(term)) for term in search_text.split()]
         
-        candidates = self.get_all_assets(category)
         matched_assets = []
         
         for asset in candidates:
-            asset_name = asset.name.lower()
-            asset_name_pinyin = self._get_pinyin(asset.name)
-            
-            asset_desc = asset.description.lower() if asset.description else ""
-            asset_desc_pinyin = self._get_pinyin(asset.description) if asset.description else ""
-            
-            asset_category = asset.category.lower()
-            asset_category_pinyin = self._get_pinyin(asset.category)
-            
-            # 模糊匹配：检查是否包含搜索文本
-            if (search_text in asset_name or 
-                search_pinyin in asset_name_pinyin or
-                search_text in asset_desc or 
-                search_pinyin in asset_desc_pinyin or
-                search_text in asset_category or 
-                search_pinyin in asset_category_pinyin):
+            fields = (asset.name, asset.description or "", asset.category)
+            haystack = _search_haystack(*fields)
+            # 先检查原文匹配，命中后无需再进行拼音转换；模糊匹配：检查拼音是否包含搜索文本
+            if all(term in haystack or term_pinyin in _pinyin_haystack(*fields)
+                   for term, term_pinyin in search_terms):
                 matched_assets.append(asset)
         
-        logger.debug(f"搜索 '{search_text}' 找到 {len(matched_assets)} 个匹配的资产")
+        logger.debug("搜索 '%s' 找到 %d 个匹配的资产", search_text, len(matched_assets))
         return matched_assets
     
     def sort_assets(self, assets: List[Asset], sort_method: str) -> List[Asset]:
@@ -1042,31 +1199,11 @@ class AssetManagerLogic(QObject):
             return []
         
         try:
-            if sort_method == "添加时间（最新）":
-                # 按创建时间降序（最新的在前）
-                # 使用安全的排序键，确保 created_time 不为 None
-                sorted_assets = sorted(assets, key=lambda x: x.created_time if x.created_time else datetime.min, reverse=True)
-            elif sort_method == "添加时间（最旧）":
-                # 按创建时间升序（最旧的在前）
-                # 使用安全的排序键，确保 created_time 不为 None
-                sorted_assets = sorted(assets, key=lambda x: x.created_time if x.created_time else datetime.min, reverse=False)
-            elif sort_method == "名称（A-Z）":
-                # 按名称升序
-                sorted_assets = sorted(assets, key=lambda x: x.name.lower())
-            elif sort_method == "名称（Z-A）":
-                # 按名称降序
-                sorted_assets = sorted(assets, key=lambda x: x.name.lower(), reverse=True)
-            elif sort_method == "分类（A-Z）":
-                # 按分类升序，同分类内按名称排序
-                sorted_assets = sorted(assets, key=lambda x: (x.category.lower(), x.name.lower()))
-            elif sort_method == "分类（Z-A）":
-                # 按分类降序，同分类内按名称排序
-                sorted_assets = sorted(assets, key=lambda x: (x.category.lower(), x.name.lower()), reverse=True)
-            else:
-                # 默认按添加时间降序
-                sorted_assets = sorted(assets, key=lambda x: x.created_time, reverse=True)
+            # 未知排序方式默认按添加时间降序
+            sort_key, reverse = _SORT_METHODS.get(sort_method, _SORT_METHODS["添加时间（最新）"])
+            sorted_assets = sorted(assets, key=sort_key, reverse=reverse)
             
-            logger.debug(f"资产已按 '{sort_method}' 排序，共 {len(sorted_assets)} 个")
+            logger.debug("资产已按 '%s' 排序，共 %d 个", sort_method, len(sorted_assets))
             return sorted_assets
         except Exception as e:
             logger.error(f"排序资产时出错: {e}", exc_info=True)
@@ -1149,14 +1286,7 @@ class AssetManagerLogic(QObject):
         if path.is_file():
             return path.stat().st_size
         elif path.is_dir():
-            total_size = 0
-            for item in path.rglob('*'):
-                if item.is_file():
-                    try:
-                        total_size += item.stat().st_size
-                    except:
-                        pass
-            return total_size
+            return _get_dir_size(path)
         return 0
     
     def set_preview_project(self, project_path: Path) -> bool:
@@ -1852,16 +1982,12 @@ class AssetManagerLogic(QObject):
         Returns:
             进程对象（如果可获取），用于监听引擎关闭；否则返回None
         """
-        # 查找.uproject文件
-        uproject_files = list(project_path.glob("*.uproject"))
-        if not uproject_files:
+        # 查找.uproject文件（找到第一个即停止，无需列出全部匹配项）
+        uproject_file = next(project_path.glob("*.uproject"), None)
+        if uproject_file is None:
             raise FileNotFoundError(f"未找到.uproject文件: {project_path}")
         
-        uproject_file = uproject_files[0]
-        
         # 使用subprocess.Popen启动，以便获取进程对象
-        import sys
-        
         try:
             if sys.platform == "win32":
                 # Windows: 使用cmd /c start 启动，并通过psutil查找进程
@@ -1876,7 +2002,6 @@ class AssetManagerLogic(QObject):
                 
                 # Windows的shell=True会立即返回，需要找到实际的UE进程
                 # 等待一下让UE启动
-                import time
                 time.sleep(2)
                 
                 # 尝试通过进程名查找UE编辑器进程
@@ -1916,20 +2041,10 @@ class AssetManagerLogic(QObject):
         try:
             import psutil
             
-            # 虚幻引擎编辑器的常见进程名
-            ue_process_names = [
-                'UE4Editor.exe',
-                'UE4Editor-Win64-Debug.exe',
-                'UE4Editor-Win64-DebugGame.exe',
-                'UnrealEditor.exe',
-                'UnrealEditor-Win64-Debug.exe',
-                'UnrealEditor-Win64-DebugGame.exe',
-            ]
-            
             # 遍历所有进程
             for proc in psutil.process_iter(['name', 'create_time']):
                 try:
-                    if proc.info['name'] in ue_process_names:
+                    if proc.info['name'] in _UE_EDITOR_PROCESS_NAMES:
                         # 找到最近启动的UE进程
                         return proc
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -1969,16 +2084,7 @@ class AssetManagerLogic(QObject):
                 proc = psutil.Process(self.current_preview_process.pid)
                 
                 # 验证这确实是一个UE进程
-                ue_process_names = [
-                    'UE4Editor.exe',
-                    'UE4Editor-Win64-Debug.exe',
-                    'UE4Editor-Win64-DebugGame.exe',
-                    'UnrealEditor.exe',
-                    'UnrealEditor-Win64-Debug.exe',
-                    'UnrealEditor-Win64-DebugGame.exe',
-                ]
-                
-                if proc.name() not in ue_process_names:
+                if proc.name() not in _UE_EDITOR_PROCESS_NAMES:
                     logger.warning(f"进程 {proc.pid} 不是UE进程，跳过关闭")
                     self.current_preview_process = None
                     self.current_preview_project_path = None
@@ -1992,7 +2098,6 @@ class AssetManagerLogic(QObject):
                 preview_project_path = self.current_preview_project_path
                 
                 # 等待进程结束，最多等待10秒
-                import time
                 for i in range(10):
                     if not proc.is_running():
                         logger.info("预览工程已成功关闭")
@@ -2214,15 +2319,19 @@ class AssetManagerLogic(QObject):
                 latest_mtime = 0
                 
                 # 在 Saved 目录下查找所有 PNG 文件（包括 Saved 根目录和所有子目录）
-                for file_path in saved_dir.rglob("*.png"):
-                    # 跳过 Screenshots 子目录中的文件（已在第一步检查过）
-                    if "Screenshots" in str(file_path):
-                        continue
+                for root, dirs, files in os.walk(saved_dir):
+                    # 跳过 Screenshots 子目录（已在第一步检查过），直接不进入遍历
+                    dirs[:] = [d for d in dirs if d != "Screenshots"]
                     
-                    mtime = file_path.stat().st_mtime
-                    if mtime > latest_mtime:
-                        latest_mtime = mtime
-                        latest_autosave = file_path
+                    for name in files:
+                        if not name.lower().endswith(".png"):
+                            continue
+                        
+                        file_path = Path(root) / name
+                        mtime = file_path.stat().st_mtime
+                        if mtime > latest_mtime:
+                            latest_mtime = mtime
+                            latest_autosave = file_path
                 
                 if latest_autosave:
                     logger.info(f"找到自动保存的截图: {latest_autosave}")
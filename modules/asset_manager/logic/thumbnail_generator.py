@@ -55,10 +55,9 @@ class ThumbnailGenerator:
             
             # 如果是文件夹，尝试查找文件夹中的图片
             if asset_path.is_dir():
-                for ext in ThumbnailGenerator.IMAGE_EXTENSIONS:
-                    images = list(asset_path.glob(f"*{ext}"))
-                    if images:
-                        return ThumbnailGenerator._generate_from_image(images[0], output_path)
+                image = ThumbnailGenerator.find_first_image(asset_path)
+                if image:
+                    return ThumbnailGenerator._generate_from_image(image, output_path)
             
             # 其他情况生成默认图标
             return ThumbnailGenerator._generate_default_icon(output_path, asset_type_name or asset_path.suffix.upper())
@@ -68,6 +67,26 @@ class ThumbnailGenerator:
             # 生成错误图标
             return ThumbnailGenerator._generate_default_icon(output_path, "ERR")
     
+    @staticmethod
+    def find_first_image(folder: Path) -> Optional[Path]:
+        """查找文件夹中的第一张图片（不递归）
+        
+        只遍历一次目录并按扩展名集合判断，避免对每种图片格式分别执行一次 glob。
+        
+        Args:
+            folder: 文件夹路径
+            
+        Returns:
+            找到的图片路径，没有图片或无法读取目录时返回None
+        """
+        try:
+            for item in folder.iterdir():
+                if item.suffix.lower() in ThumbnailGenerator.IMAGE_EXTENSIONS and item.is_file():
+                    return item
+        except OSError as e:
+            logger.warning(f"读取文件夹失败: {folder}, {e}")
+        return None
+    
     @classmethod
     def generate_thumbnail_async(
         cls,
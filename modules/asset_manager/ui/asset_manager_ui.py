@@ -53,7 +53,6 @@ class AssetManagerUI(QWidget):
         # 检查是否首次启动，如果是则显示首次启动对话框
         self._check_first_launch()
         
-        self.logic.get_all_assets()
         self._refresh_assets()
     
     def _connect_signals(self):
@@ -556,10 +555,7 @@ class AssetManagerUI(QWidget):
                     if asset.path.suffix.lower() in ThumbnailGenerator.IMAGE_EXTENSIONS:
                         should_generate_thumbnail = True
                 elif asset.asset_type == AssetType.PACKAGE:
-                    for ext in ThumbnailGenerator.IMAGE_EXTENSIONS:
-                        if list(asset.path.glob(f"*{ext}")):
-                            should_generate_thumbnail = True
-                            break
+                    should_generate_thumbnail = ThumbnailGenerator.find_first_image(asset.path) is not None
                 
                 if should_generate_thumbnail:
                     thumbnail_path = self.logic.thumbnails_dir / f"{asset.id}.png"
@@ -1084,19 +1080,13 @@ class AssetManagerUI(QWidget):
                         from core.utils.ue_process_utils import UEProcessUtils
                         ue_utils = UEProcessUtils()
                         
-                        # 1. 检测运行中的工程
-                        logger.info("开始检测运行中的工程...")
-                        self.progress_updated.emit(0, 100, "正在检测运行中的工程...")
-                        running_projects = ue_utils.detect_running_ue_projects()
-                        logger.info(f"检测到 {len(running_projects)} 个运行中的工程")
+                        # 1. 并行检测运行中的工程和搜索所有工程
+                        logger.info("开始检测运行中的工程并搜索所有工程...")
+                        self.progress_updated.emit(0, 100, "正在检测运行中的工程并搜索所有工程...")
+                        running_projects, all_projects = ue_utils.detect_and_search_ue_projects()
+                        logger.info(f"检测到 {len(running_projects)} 个运行中的工程，搜索到 {len(all_projects)} 个工程")
                         
-                        # 2. 搜索所有工程
-                        logger.info("开始搜索所有工程...")
-                        self.progress_updated.emit(50, 100, "正在搜索所有工程...")
-                        all_projects = ue_utils.search_all_ue_projects()
-                        logger.info(f"搜索到 {len(all_projects)} 个工程")
-                        
-                        # 3. 搜索完成
+                        # 2. 搜索完成
                         self.progress_updated.emit(100, 100, "搜索完成！")
                         self.search_completed.emit(running_projects, all_projects)
                         
@@ -87,8 +87,11 @@ class ConfigToolLogic:
                 "ui_settings": self.ui_settings
             }
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            # 原子写入（先写临时文件再替换）
+            temp_file = self.config_file + ".tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(config_data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.config_file)
             logger.info("配置文件保存成功")
         except Exception as e:
             logger.error(f"保存配置文件时出错: {e}")
@@ -119,12 +122,12 @@ class ConfigToolLogic:
     
     def get_templates(self) -> List[ConfigTemplate]:
         """获取所有配置模板"""
-        logger.info(f"获取配置模板列表，共 {len(self.config_templates)} 个模板")
+        logger.debug("获取配置模板列表，共 %d 个模板", len(self.config_templates))
         return self.config_templates
     
     def get_ui_settings(self) -> Dict[str, Any]:
         """获取UI设置"""
-        logger.info("获取UI设置")
+        logger.debug("获取UI设置")
         return self.ui_settings
     
     def _validate_path(self, path: Path, base_path: Path) -> bool:
@@ -31,19 +31,13 @@ class SearchProjectsThread(QThread):
             from core.utils.ue_process_utils import UEProcessUtils
             ue_utils = UEProcessUtils()
             
-            # 1. 检测运行中的工程
-            logger.info("开始检测运行中的工程...")
-            self.progress_updated.emit(0, 100, "正在检测运行中的工程...")
-            self.running_projects = ue_utils.detect_running_ue_projects()
-            logger.info(f"检测到 {len(self.running_projects)} 个运行中的工程")
-            
-            # 2. 搜索所有工程
-            logger.info("开始搜索所有工程...")
-            self.progress_updated.emit(50, 100, "正在搜索所有工程...")
-            self.all_projects = ue_utils.search_all_ue_projects()
-            logger.info(f"搜索到 {len(self.all_projects)} 个工程")
-            
-            # 3. 搜索完成
+            # 1. 并行检测运行中的工程和搜索所有工程
+            logger.info("开始检测运行中的工程并搜索所有工程...")
+            self.progress_updated.emit(0, 100, "正在检测运行中的工程并搜索所有工程...")
+            self.running_projects, self.all_projects = ue_utils.detect_and_search_ue_projects()
+            logger.info(f"检测到 {len(self.running_projects)} 个运行中的工程，搜索到 {len(self.all_projects)} 个工程")
+            
+            # 2. 搜索完成
             self.progress_updated.emit(100, 100, "搜索完成！")
             self.search_completed.emit(self.running_projects, self.all_projects)
             
@@ -125,8 +119,7 @@ class ConfigTemplateButton(QPushButton):
             from core.utils.ue_process_utils import UEProcessUtils
             ue_utils = UEProcessUtils()
             
-            running_projects = ue_utils.detect_running_ue_projects()
-            all_projects = ue_utils.search_all_ue_projects()
+            running_projects, all_projects = ue_utils.detect_and_search_ue_projects()
             
             self._on_search_completed(running_projects, all_projects, None)
         except Exception as e:
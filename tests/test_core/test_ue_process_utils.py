@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+"""
+UEProcessUtils 单元测试
+"""
+
+from pathlib import Path
+
+import pytest
+from core.utils import ue_process_utils
+from core.utils.ue_process_utils import UEProcess, UEProcessUtils, clear_project_search_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_search_cache():
+    """每个测试前后清空工程搜索缓存"""
+    clear_project_search_cache()
+    yield
+    clear_project_search_cache()
+
+
+class TestSearchAllUEProjects:
+    """search_all_ue_projects 测试类"""
+
+    def test_search_result_is_cached(self, monkeypatch):
+        """测试重复搜索复用缓存结果"""
+        calls = []
+        project = UEProcess(-1, "Demo", Path("Demo/Demo.uproject"))
+
+        def fake_search(self):
+            calls.append(1)
+            return [project]
+
+        monkeypatch.setattr(UEProcessUtils, "_quick_search_ue_projects", fake_search)
+        utils = UEProcessUtils()
+
+        assert utils.search_all_ue_projects() == [project]
+        assert utils.search_all_ue_projects() == [project]
+        assert len(calls) == 1
+
+    def test_search_bypass_and_clear_cache(self, monkeypatch):
+        """测试强制搜索和清除缓存"""
+        calls = []
+
+        def fake_search(self):
+            calls.append(1)
+            return []
+
+        monkeypatch.setattr(UEProcessUtils, "_quick_search_ue_projects", fake_search)
+        utils = UEProcessUtils()
+
+        utils.search_all_ue_projects()
+        utils.search_all_ue_projects(use_cache=False)
+        assert len(calls) == 2
+
+        clear_project_search_cache()
+        utils.search_all_ue_projects()
+        assert len(calls) == 3
+
+    def test_search_cache_expires(self, monkeypatch):
+        """测试缓存过期后重新搜索"""
+        calls = []
+
+        def fake_search(self):
+            calls.append(1)
+            return []
+
+        monkeypatch.setattr(UEProcessUtils, "_quick_search_ue_projects", fake_search)
+        monkeypatch.setattr(ue_process_utils, "PROJECT_SEARCH_CACHE_TTL", 0.0)
+        utils = UEProcessUtils()
+
+        utils.search_all_ue_projects()
+        utils.search_all_ue_projects()
+        assert len(calls) == 2
+
+
+class TestShouldExcludePath:
+    """_should_exclude_path 测试类"""
+
+    @pytest.mark.parametrize("path", [
+        "C:\\Program Files\\Epic Games\\UE_5.3\\Demo",
+        "D:\\UnrealEngine\\Engine\\Content",
+        "C:\\Users\\dev\\AppData\\Local\\Demo",
+        "E:\\$RECYCLE.BIN\\Demo",
+        "D:\\Work\\Temp\\Demo",
+    ])
+    def test_excluded_paths(self, path):
+        """测试命中排除规则的路径"""
+        assert UEProcessUtils()._should_exclude_path(path)
+
+    @pytest.mark.parametrize("path", [
+        "D:\\Projects\\MyGame",
+        "C:\\Users\\dev\\Documents\\Unreal Projects\\EngineTest",
+        "D:\\Work\\Templates2\\Demo",
+    ])
+    def test_included_paths(self, path):
+        """测试不应被排除的路径"""
+        assert not UEProcessUtils()._should_exclude_path(path)
+
+
+class TestDetectAndSearchUEProjects:
+    """detect_and_search_ue_projects 测试类"""
+
+    def test_returns_running_and_all_projects(self, monkeypatch):
+        """测试同时返回运行中的工程和所有工程"""
+        running = [UEProcess(100, "UnrealEditor.exe", Path("Run/Run.uproject"))]
+        found = [UEProcess(-1, "Demo", Path("Demo/Demo.uproject"))]
+
+        monkeypatch.setattr(UEProcessUtils, "detect_running_ue_projects", lambda self: running)
+        monkeypatch.setattr(UEProcessUtils, "_quick_search_ue_projects", lambda self: found)
+
+        assert UEProcessUtils().detect_and_search_ue_projects() == (running, found)
+
+
+class TestQuickSearchUEProjects:
+    """_quick_search_ue_projects 测试类"""
+
+    def test_nested_locations_are_deduplicated(self, tmp_path, monkeypatch):
+        """测试嵌套的搜索位置不会返回重复工程"""
+        project_dir = tmp_path / "Projects" / "Demo"
+        project_dir.mkdir(parents=True)
+        (project_dir / "Demo.uproject").write_text("{}", encoding="utf-8")
+
+        locations = [tmp_path, tmp_path / "Projects"]
+        monkeypatch.setattr(UEProcessUtils, "_get_common_project_locations", lambda self: locations)
+
+        projects = UEProcessUtils()._quick_search_ue_projects()
+        assert [p.name for p in projects] == ["Demo"]